@@ -7,11 +7,13 @@ Combines Pygame window with embedded web browser for best of both worlds
 import os
 import sys
 import json
+import queue
 import base64
 import threading
 import time
 import hashlib
 import webbrowser
+from collections import namedtuple
 from io import BytesIO
 import numpy as np
 from PIL import Image
@@ -34,6 +36,9 @@ except ImportError:
     WEBVIEW_AVAILABLE = False
     print("--------------Hybrid Preview Monitor: Webview not available. Install with: pip install pywebview")
 
+# 缓存中的图片以原始像素存储，显示线程可直接 frombuffer，无需每帧 tobytes()
+CachedImage = namedtuple("CachedImage", ["raw", "size", "mode"])
+
 class HybridPreviewMonitor:
     """
     Hybrid preview monitor using Pygame window with embedded web browser
@@ -44,7 +49,8 @@ class HybridPreviewMonitor:
     _server = None
     _server_thread = None
     _port = 5060
-    _image_cache = {}
+    _image_cache = {}  # image_id -> CachedImage(raw, size, mode)
+    _frame_queue_size = 32  # 每个窗口待转换帧队列的上限，满时丢弃最旧的
     
     # 新增：队列数据结构
     _display_queue = []  # 存储显示队列数据
@@ -100,6 +106,16 @@ class HybridPreviewMonitor:
         print("Hybrid Preview Monitor: Available resolutions:", resolution_list)
         return resolution_list
     
+    @classmethod
+    def _parse_resolution(cls, target_resolution):
+        """Parse a "WIDTHxHEIGHT" string into an (int, int) tuple"""
+        try:
+            width, height = (int(x) for x in target_resolution.split('x'))
+            return (width, height)
+        except Exception as e:
+            print(f"⚠️ [WARNING] Could not parse target resolution {target_resolution}: {e}")
+            return (1920, 1080)
+    
     @classmethod
     def INPUT_TYPES(cls):
         """Define input types for ComfyUI"""
@@ -177,8 +193,9 @@ class HybridPreviewMonitor:
                         self.send_response(200)
                         self.send_header('Content-type', 'image/png')
                         self.end_headers()
-                        # 直接从PIL Image转换为字节
-                        pil_img = cls._image_cache[image_id]
+                        # 从缓存的原始像素重建PIL Image（共享内存，不复制）
+                        cached = cls._image_cache[image_id]
+                        pil_img = Image.frombuffer(cached.mode, cached.size, cached.raw, 'raw', cached.mode, 0, 1)
                         buffer = BytesIO()
                         pil_img.save(buffer, format='PNG')
                         self.wfile.write(buffer.getvalue())
@@ -648,11 +665,31 @@ class HybridPreviewMonitor:
         # Generate unique ID
         img_id = hashlib.md5(img_str.encode()).hexdigest()[:16]
         
-        # Cache the image (store PIL Image directly for easier access)
-        cls._image_cache[img_id] = pil_img
+        # Cache the raw pixels once so the display thread never re-encodes them
+        cached = CachedImage(pil_img.tobytes(), pil_img.size, pil_img.mode)
+        cls._image_cache[img_id] = cached
+        cls._publish_frame(img_id, cached)
         
         return img_id
     
+    @classmethod
+    def _publish_frame(cls, img_id, cached):
+        """Hand raw pixels to every window thread; surfaces are only ever created on the window thread"""
+        for window in list(cls._windows.values()):
+            frame_queue = window.get("frame_queue")
+            if frame_queue is None:
+                continue
+            while True:
+                try:
+                    frame_queue.put_nowait((img_id, cached))
+                    break
+                except queue.Full:
+                    # Drop the oldest pending frame; the window can still rebuild it from _image_cache
+                    try:
+                        frame_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+    
     @classmethod
     def _add_to_queue(cls, images, compare_images=None, mode="new", display_mode="simple"):
         """添加图片到显示队列"""
@@ -843,6 +880,7 @@ class HybridPreviewMonitor:
             'display_mode': current_display_mode,
             'fit_mode': fit_mode,
             'target_resolution': target_resolution,
+            '_target_wh': cls._parse_resolution(target_resolution),  # parsed once here, read per frame
             'gain': gain,
             'gamma': gamma,
             'saturation': saturation,
@@ -896,19 +934,17 @@ class HybridPreviewMonitor:
         
         def pygame_window_thread():
             try:
-                # Initialize pygame
+                # Initialize pygame; joystick and audio are never used, so stop SDL polling them
                 pygame.init()
+                pygame.joystick.quit()
+                pygame.mixer.quit()
                 
                 # Force initialization of all closure variables - ensure they're always defined
                 if 'settings' not in locals() or settings is None:
                     settings = {}
                 
-                # Get target resolution from settings
-                target_resolution = settings.get('target_resolution', '1920x1080')
-                try:
-                    target_w, target_h = map(int, target_resolution.split('x'))
-                except Exception:
-                    target_w, target_h = 1920, 1080
+                # Get target resolution from settings (parsed by display_image)
+                target_w, target_h = settings.get('_target_wh', (1920, 1080))
                 
                 # Use target resolution directly as window size
                 width, height = target_w, target_h
@@ -926,8 +962,13 @@ class HybridPreviewMonitor:
                     print(f"Warning: Could not set window position for monitor {monitor_idx}: {e}")
                 
                 # Create window on specified monitor
-                screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+                screen = cls._set_display_mode((width, height))
                 pygame.display.set_caption(f'Hybrid Preview Monitor {monitor_idx} (Enhanced Pygame) - {width}x{height}')
+                # Only queue the event types the loop handles (plus resize/expose for the SCALED window)
+                pygame.event.set_blocked(None)
+                pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                          pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.VIDEOEXPOSE, pygame.VIDEORESIZE,
+                                          pygame.WINDOWEXPOSED])
                 
                 # Maximize window on first run
                 try:
@@ -948,7 +989,7 @@ class HybridPreviewMonitor:
                             print(f"⚠️ [WARNING] Windows API maximize failed: {e}")
                             # Fallback: try to set window to fullscreen then back to windowed
                             try:
-                                screen = pygame.display.set_mode((width, height), pygame.RESIZABLE | pygame.FULLSCREEN)
+                                screen = cls._set_display_mode((width, height), pygame.FULLSCREEN)
                                 pygame.display.toggle_fullscreen()
                                 print(f"🔍 [DEBUG] Window maximized using fullscreen toggle for monitor {monitor_idx}")
                             except Exception as e2:
@@ -956,7 +997,7 @@ class HybridPreviewMonitor:
                     else:
                         # For non-Windows systems, try fullscreen toggle
                         try:
-                            screen = pygame.display.set_mode((width, height), pygame.RESIZABLE | pygame.FULLSCREEN)
+                            screen = cls._set_display_mode((width, height), pygame.FULLSCREEN)
                             pygame.display.toggle_fullscreen()
                             print(f"🔍 [DEBUG] Window maximized using fullscreen toggle for monitor {monitor_idx}")
                         except Exception as e:
@@ -1035,14 +1076,14 @@ class HybridPreviewMonitor:
                 # Try to maximize window after creation
                 try:
                     # Method 1: Try to set window to fullscreen then back to windowed
-                    screen = pygame.display.set_mode((width, height), pygame.RESIZABLE | pygame.FULLSCREEN)
+                    screen = cls._set_display_mode((width, height), pygame.FULLSCREEN)
                     pygame.display.toggle_fullscreen()
                     print(f"🔍 [DEBUG] Window maximized using fullscreen toggle for monitor {monitor_idx}")
                 except Exception as e:
                     print(f"⚠️ [WARNING] Could not maximize window: {e}")
                     # Method 2: Try to resize window to monitor resolution
                     try:
-                        screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+                        screen = cls._set_display_mode((width, height))
                         print(f"🔍 [DEBUG] Window resized to monitor resolution for monitor {monitor_idx}")
                     except Exception as e2:
                         print(f"⚠️ [WARNING] Could not resize window: {e2}")
@@ -1054,6 +1095,17 @@ class HybridPreviewMonitor:
                 display_mode = settings.get('display_mode', 'single')
                 zoom = 1.0
                 pan_x, pan_y = 0, 0
+                half_w, half_h = width >> 1, height >> 1  # recomputed only when the window is resized
+                
+                def apply_zoom(mouse_x, mouse_y, zoom_factor, zoom, pan_x, pan_y):
+                    """Zoom around the mouse position, returning the new (zoom, pan_x, pan_y)"""
+                    new_zoom = max(0.1, min(5.0, zoom * zoom_factor))
+                    if new_zoom == zoom:
+                        return zoom, pan_x, pan_y
+                    # Keep the world point under the mouse fixed while zooming
+                    world_x = (mouse_x - half_w - pan_x) / zoom
+                    world_y = (mouse_y - half_h - pan_y) / zoom
+                    return new_zoom, mouse_x - half_w - world_x * new_zoom, mouse_y - half_h - world_y * new_zoom
                 dragging = False
                 last_mouse_pos = (0, 0)
                 
@@ -1064,6 +1116,26 @@ class HybridPreviewMonitor:
                 slideshow_timer = 0
                 slideshow_interval = 2000  # 2 seconds per image
                 
+                # Surfaces owned by this thread, built from raw pixels published by display_image
+                surfaces = {}  # image_id -> pygame.Surface
+                frame_queue = cls._windows.get(monitor_idx, {}).get("frame_queue")
+                
+                def get_surface(img_id):
+                    """Return the surface for an image id, building it from the cache if it was not queued"""
+                    surface = surfaces.get(img_id)
+                    if surface is None:
+                        cached = cls._image_cache.get(img_id)
+                        if cached is None:
+                            return None
+                        surface = pygame.image.frombuffer(cached.raw, cached.size, cached.mode)
+                        surfaces[img_id] = surface
+                    return surface
+                
+                # Dirty-rectangle tracking: only regions drawn last frame are cleared and
+                # presented, unless the display surface was (re)created
+                drawn_rects = []
+                full_redraw = True
+                
                 # Font for UI
                 try:
                     font = pygame.font.Font(None, 24)
@@ -1083,49 +1155,68 @@ class HybridPreviewMonitor:
                             print(f"🔍 [DEBUG] Number input timeout, cleared")
                     
                     # Check if window should be closed
-                    if monitor_idx in cls._windows and not cls._windows[monitor_idx]["visible"]:
+                    window_entry = cls._windows.get(monitor_idx)
+                    if window_entry is not None and not window_entry["visible"]:
                         running = False
                         break
                     
                     # Check for data updates
-                    if monitor_idx in cls._windows:
-                        with cls._windows[monitor_idx]["lock"]:
-                            window_data = cls._windows[monitor_idx]
-                            if (window_data.get("refresh_needed", False) or 
-                                window_data.get("settings") != last_settings):
-                                
-                                new_settings = window_data.get("settings", settings)
-                                if new_settings is not None:
-                                    settings = new_settings
-                                new_current_idx = window_data.get("current_idx", current_idx)
-                                if new_current_idx != current_idx:
-                                    current_idx = new_current_idx
-                                    print(f"🔍 [DEBUG] Updated current_idx to: {current_idx}")
-                                
-                                # Check if resolution changed and recreate window if needed
-                                new_target_resolution = settings.get('target_resolution', '1920x1080')
-                                try:
-                                    new_w, new_h = map(int, new_target_resolution.split('x'))
-                                    if new_w != width or new_h != height:
-                                        # Update window size
-                                        width, height = new_w, new_h
-                                        screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
-                                        pygame.display.set_caption(f'Hybrid Preview Monitor {monitor_idx} (Enhanced Pygame) - {width}x{height}')
-                                        print(f"✅ [DEBUG] Window resized to {width}x{height}")
-                                except Exception as e:
-                                    print(f"⚠️ [WARNING] Could not parse target resolution {new_target_resolution}: {e}")
-                                
-                                # Update tracking variables
-                                last_settings = settings
-                                
-                                # Clear refresh flag
-                                window_data["refresh_needed"] = False
+                    if window_entry is not None:
+                        # Snapshot under the lock and clear the refresh flag in the same
+                        # critical section, so the producer is only blocked for a dict copy
+                        with window_entry["lock"]:
+                            window_data = window_entry.copy()
+                            if window_data.get("refresh_needed", False):
+                                window_entry["refresh_needed"] = False
+                        
+                        new_settings = window_data.get("settings")
+                        # display_image always publishes a fresh settings dict, so identity is enough
+                        if window_data.get("refresh_needed", False) or new_settings is not last_settings:
+                            if new_settings is not None:
+                                settings = new_settings
+                            new_current_idx = window_data.get("current_idx", current_idx)
+                            if new_current_idx != current_idx:
+                                current_idx = new_current_idx
+                                print(f"🔍 [DEBUG] Updated current_idx to: {current_idx}")
+                            
+                            # Check if resolution changed and recreate window if needed
+                            new_w, new_h = settings.get('_target_wh', (width, height))
+                            if new_w != width or new_h != height:
+                                # Update window size
+                                width, height = new_w, new_h
+                                half_w, half_h = width >> 1, height >> 1
+                                screen = cls._set_display_mode((width, height))
+                                full_redraw = True
+                                pygame.display.set_caption(f'Hybrid Preview Monitor {monitor_idx} (Enhanced Pygame) - {width}x{height}')
+                                print(f"✅ [DEBUG] Window resized to {width}x{height}")
+                            
+                            # Update tracking variables
+                            last_settings = new_settings
                                 
+                    # Convert newly published frames before drawing
+                    if frame_queue is not None:
+                        drained = False
+                        while True:
+                            try:
+                                img_id, cached = frame_queue.get_nowait()
+                            except queue.Empty:
+                                break
+                            surfaces[img_id] = pygame.image.frombuffer(cached.raw, cached.size, cached.mode)
+                            drained = True
+                        if drained:
+                            # Forget surfaces whose pixels were dropped from the shared cache
+                            for img_id in list(surfaces):
+                                if img_id not in cls._image_cache:
+                                    del surfaces[img_id]
+                    
+                    wheel_steps = 0  # net wheel notches this frame, applied as a single zoom step
                     for event in pygame.event.get():
                         if event.type == pygame.QUIT:
                             print(f"🔍 [DEBUG] Window {monitor_idx} received QUIT event")
                             running = False
                             break
+                        elif event.type == pygame.VIDEOEXPOSE:
+                            full_redraw = True
                         elif event.type == pygame.KEYDOWN:
                             # Check for modifier keys
                             ctrl_pressed = pygame.key.get_pressed()[pygame.K_LCTRL] or pygame.key.get_pressed()[pygame.K_RCTRL]
@@ -1180,24 +1271,26 @@ class HybridPreviewMonitor:
                                 pan_y += dy
                                 last_mouse_pos = event.pos
                         elif event.type == pygame.MOUSEWHEEL:
-                            # Zoom with mouse wheel - zoom around mouse position
+                            # Accumulate; high-rate trackpads can emit many wheel events per frame
+                            wheel_steps += 1 if event.y > 0 else -1
+                    
+                    # Zoom with mouse wheel - zoom around mouse position, once per frame
+                    if wheel_steps:
+                        zoom_in = wheel_steps > 0
+                        # Nothing to do when zoom is already pinned at the limit
+                        if not ((zoom_in and zoom >= 5.0) or (not zoom_in and zoom <= 0.1)):
+                            zoom_factor = 1.1 ** wheel_steps if zoom_in else 0.9 ** -wheel_steps
                             mouse_x, mouse_y = pygame.mouse.get_pos()
-                            old_zoom = zoom
-                            zoom_factor = 1.1 if event.y > 0 else 0.9
-                            zoom = max(0.1, min(5.0, zoom * zoom_factor))
-                            
-                            # Adjust pan to keep mouse position fixed during zoom
-                            if old_zoom != zoom:
-                                # Calculate the point under the mouse before zoom
-                                world_x = (mouse_x - width // 2 - pan_x) / old_zoom
-                                world_y = (mouse_y - height // 2 - pan_y) / old_zoom
-                                
-                                # Calculate new pan to keep the same world point under the mouse
-                                pan_x = mouse_x - width // 2 - world_x * zoom
-                                pan_y = mouse_y - height // 2 - world_y * zoom
+                            zoom, pan_x, pan_y = apply_zoom(mouse_x, mouse_y, zoom_factor, zoom, pan_x, pan_y)
                     
-                    # Clear screen
-                    screen.fill((0, 0, 0))
+                    # Clear screen (only the regions drawn last frame)
+                    if full_redraw:
+                        screen.fill((0, 0, 0))
+                    else:
+                        for rect in drawn_rects:
+                            screen.fill((0, 0, 0), rect)
+                    dirty_rects = drawn_rects
+                    drawn_rects = []
                     
                     # Display current image(s) using queue system
                     current_image_info = cls._get_image_by_index(current_idx)
@@ -1206,11 +1299,8 @@ class HybridPreviewMonitor:
                             # Get main image
                             main_img_id = current_image_info.get("image")
                             if main_img_id:
-                                pil_img = cls._image_cache.get(main_img_id)
-                                if pil_img:
-                                    # Convert to pygame surface
-                                    img_surface = pygame.image.fromstring(pil_img.tobytes(), pil_img.size, pil_img.mode)
-                                    
+                                img_surface = get_surface(main_img_id)
+                                if img_surface is not None:
                                     # Apply zoom and pan
                                     if zoom != 1.0:
                                         new_size = (int(img_surface.get_width() * zoom), int(img_surface.get_height() * zoom))
@@ -1232,13 +1322,10 @@ class HybridPreviewMonitor:
                                         
                                         # Get comparison image
                                         comp_img_id = current_image_info.get("compare_image")
-                                        comp_pil_img = None
-                                        if comp_img_id:
-                                            comp_pil_img = cls._image_cache.get(comp_img_id)
+                                        comp_surface = get_surface(comp_img_id) if comp_img_id else None
                                         
-                                        if comp_pil_img:
+                                        if comp_surface is not None:
                                             # Resize comparison image to match main image size
-                                            comp_surface = pygame.image.fromstring(comp_pil_img.tobytes(), comp_pil_img.size, comp_pil_img.mode)
                                             comp_surface = pygame.transform.scale(comp_surface, img_surface.get_size())
                                             
                                             # Apply same zoom and pan to both images
@@ -1248,22 +1335,22 @@ class HybridPreviewMonitor:
                                             # Left side - current image
                                             left_rect = img_rect.copy()
                                             left_rect.width = split_x
-                                            screen.blit(img_surface, left_rect, (0, 0, split_x - left_rect.x, img_rect.height))
+                                            drawn_rects.append(screen.blit(img_surface, left_rect, (0, 0, split_x - left_rect.x, img_rect.height)))
                                             
                                             # Right side - comparison image (same size as main image)
                                             right_rect = img_rect.copy()
                                             right_rect.x = split_x
                                             right_rect.width = width - split_x
-                                            screen.blit(comp_surface, right_rect, (split_x - img_rect.x, 0, right_rect.width, img_rect.height))
+                                            drawn_rects.append(screen.blit(comp_surface, right_rect, (split_x - img_rect.x, 0, right_rect.width, img_rect.height)))
                                             
                                             # Draw split line
-                                            pygame.draw.line(screen, (255, 255, 255), (split_x, 0), (split_x, height), 2)
+                                            drawn_rects.append(pygame.draw.line(screen, (255, 255, 255), (split_x, 0), (split_x, height), 2))
                                         else:
                                             # Fallback to single image if comparison image not available
-                                            screen.blit(img_surface, img_rect)
+                                            drawn_rects.append(screen.blit(img_surface, img_rect))
                                     else:
                                         # Simple mode - single image
-                                        screen.blit(img_surface, img_rect)
+                                        drawn_rects.append(screen.blit(img_surface, img_rect))
                                     
                         except Exception as e:
                             print(f"Error displaying image: {e}")
@@ -1273,7 +1360,7 @@ class HybridPreviewMonitor:
                         # Display "No Image" text
                         no_image_text = font.render("No Image Available", True, (255, 255, 255))
                         text_rect = no_image_text.get_rect(center=(width // 2, height // 2))
-                        screen.blit(no_image_text, text_rect)
+                        drawn_rects.append(screen.blit(no_image_text, text_rect))
                     
                     # Draw UI info
                     current_image_info = cls._get_image_by_index(current_idx)
@@ -1298,7 +1385,7 @@ class HybridPreviewMonitor:
                         remaining_time = (slideshow_interval - slideshow_timer) / 1000
                         info_text += f" | Next: {remaining_time:.1f}s"
                     text_surface = font.render(info_text, True, (255, 255, 255))
-                    screen.blit(text_surface, (10, 10))
+                    drawn_rects.append(screen.blit(text_surface, (10, 10)))
                     
                     # Draw controls
                     controls = [
@@ -1307,9 +1394,13 @@ class HybridPreviewMonitor:
                     ]
                     for i, control in enumerate(controls):
                         control_surface = font.render(control, True, (200, 200, 200))
-                        screen.blit(control_surface, (10, height - 60 + i * 25))
+                        drawn_rects.append(screen.blit(control_surface, (10, height - 60 + i * 25)))
                     
-                    pygame.display.flip()
+                    if full_redraw:
+                        pygame.display.flip()
+                        full_redraw = False
+                    else:
+                        pygame.display.update(dirty_rects + drawn_rects)
                     clock.tick(60)
                 
                 pygame.quit()
@@ -1370,12 +1461,22 @@ class HybridPreviewMonitor:
             "visible": True,
             "running": True,
             "current_idx": latest_index if latest_index is not None else (min(cls._image_index_map.keys()) if cls._image_index_map else 1),
-            "refresh_needed": False
+            "refresh_needed": False,
+            "frame_queue": queue.Queue(maxsize=cls._frame_queue_size)
         }
         
         # Start window thread
         cls._windows[monitor_idx]["thread"].start()
     
+    @classmethod
+    def _set_display_mode(cls, size, extra_flags=0):
+        """Create the display surface with SDL-side scaling and vsync, falling back to a plain resizable window"""
+        try:
+            return pygame.display.set_mode(size, pygame.SCALED | pygame.RESIZABLE | extra_flags, vsync=1)
+        except pygame.error as e:
+            print(f"⚠️ [WARNING] SCALED/vsync display mode unavailable ({e}), using plain resizable window")
+            return pygame.display.set_mode(size, pygame.RESIZABLE | extra_flags)
+    
     @classmethod
     def _get_monitor_info(cls, monitor_idx):
         """Get monitor information"""
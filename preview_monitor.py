@@ -1,9 +1,16 @@
+import atexit
+import logging
 import os
+import queue
+import sys
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, List, NamedTuple, Optional
 import numpy as np
 from PIL import Image
 from threading import Thread, Lock
 import time
-import hashlib
 
 try:
     import pygame
@@ -12,45 +19,300 @@ except ImportError:
     PYGAME_AVAILABLE = False
     print("Warning: pygame not installed. PreviewImageMonitor will not display images.")
 
+# Posted by display_image (from the ComfyUI thread) to wake a window loop blocked in event.wait()
+_WAKE_EVENT = pygame.USEREVENT + 1 if PYGAME_AVAILABLE else None
+
 try:
     from screeninfo import get_monitors
     SCREENINFO_AVAILABLE = True
 except ImportError:
     SCREENINFO_AVAILABLE = False
 
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # Not parallel=True: numba's threading layer is process-wide and this runs off the main thread
+    # (TBB then hangs the interpreter at exit, workqueue aborts on concurrent launches from other
+    # nodes). nogil lets _run_in_bands spread row bands over the band pool instead.
+    @njit(fastmath=True, nogil=True)
+    def _bilinear_zoom(src, dst, x0, y0, scale_x, scale_y):
+        """Bilinear magnification of src into dst.
+
+        dst[y, x] samples src at ((x0 + x + 0.5) * scale_x - 0.5, (y0 + y + 0.5) * scale_y - 0.5),
+        i.e. pixel-centre aligned like PIL/OpenCV, with (x0, y0) the region offset in the
+        magnified image. Weights are 8-bit fixed point. Only valid for scale <= 1 (no
+        antialiasing for downscales).
+        """
+        src_h, src_w, channels = src.shape
+        dst_h, dst_w = dst.shape[0], dst.shape[1]
+        # Column taps and weights are the same for every row
+        xs0 = np.empty(dst_w, dtype=np.int64)
+        xs1 = np.empty(dst_w, dtype=np.int64)
+        wxs = np.empty(dst_w, dtype=np.int32)
+        for x in range(dst_w):
+            sx = max((x0 + x + 0.5) * scale_x - 0.5, 0.0)
+            ix = min(int(sx), src_w - 1)
+            xs0[x] = ix
+            xs1[x] = min(ix + 1, src_w - 1)
+            wxs[x] = int((sx - ix) * 256.0 + 0.5)
+        for y in range(dst_h):
+            sy = max((y0 + y + 0.5) * scale_y - 0.5, 0.0)
+            iy0 = min(int(sy), src_h - 1)
+            wy = int((sy - iy0) * 256.0 + 0.5)
+            row0 = src[iy0]
+            row1 = src[min(iy0 + 1, src_h - 1)]
+            out = dst[y]
+            for x in range(dst_w):
+                a = xs0[x]
+                b = xs1[x]
+                wx = wxs[x]
+                for c in range(channels):
+                    top = row0[a, c] * (256 - wx) + row0[b, c] * wx
+                    bottom = row1[a, c] * (256 - wx) + row1[b, c] * wx
+                    out[x, c] = (top * (256 - wy) + bottom * wy + 32768) >> 16
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters fall back to a regular __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class ViewState(NamedTuple):
+    """Zoom and pan of a window, replaced as a whole rather than mutated."""
+    zoom: float = 1.0
+    pan_x: float = 0.0
+    pan_y: float = 0.0
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class WindowState:
+    """Per-monitor window state shared between display_image and the window thread.
+
+    Fields are guarded by ``lock``; the window loop snapshots what it needs
+    and records the ``last_*`` bookkeeping in a single critical section.
+    ``view`` is the exception: only the window thread writes it, always by
+    rebinding a new ``ViewState``, so readers see either the old or the new
+    tuple and input handling never takes the lock for zoom/pan.
+
+    Key handlers also store ``display_mode`` and ``visible`` without the lock:
+    each is a single attribute store (atomic under the GIL), display_image
+    overwriting it concurrently is last-write-wins either way, and the only
+    reader that needs fields to agree is the same thread's snapshot. Updates
+    that depend on other fields (``current_idx`` against ``images``) keep it.
+    """
+    images: List[Image.Image]
+    compare_image: List[Image.Image]
+    display_mode: str
+    fit_mode: str
+    res_w: int
+    res_h: int
+    gain: float
+    gamma: float
+    saturation: float
+    white_matte: bool
+    fps_mode: str
+    current_idx: int = 0
+    lock: Any = field(default_factory=Lock)
+    visible: bool = True
+    running: bool = True
+    view: ViewState = ViewState()
+    revision: int = 0  # bumped by display_image whenever images are replaced
+    thread: Optional[Thread] = None
+    quality_tier: str = "high"  # render quality step, only read and written by the window thread
+    # Inputs of the frame on screen and its Surface; display_image clears "key" with new images
+    scale_cache: dict = field(default_factory=lambda: {"key": None, "surf": None, "pos": (0, 0)})
+    # What the window loop last rendered (smart fps mode)
+    last_revision: Optional[int] = None
+    last_fit_mode: Optional[str] = None
+    last_white_matte: Optional[bool] = None
+    last_display_mode: Optional[str] = None
+    last_current_idx: Optional[int] = None
+    last_view: ViewState = ViewState()
+    last_mouse_x: Optional[int] = None
+
+
+# Worker pool for band-parallel numpy copies; numpy releases the GIL while copying uint8 data,
+# so the bands of one frame run concurrently. Threads are only started on first use.
+_band_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="PreviewMonitorBand")
+_BAND_COUNT = 4
+_BAND_MIN_ROWS = 256  # below this a single copy is cheaper than dispatching
+
+
+# Printed by the H key
+_HELP_TEXT = """Preview Monitor Controls:
+  ESC - Hide window
+  S - Toggle slideshow mode
+  C - Toggle comparison mode
+  Left/Right Arrow - Navigate images (slideshow mode)
+  Mouse Movement - Control split line in comparison mode
+  Mouse Wheel - Zoom in/out
+  Left Mouse Drag - Pan image
+  +/- - Zoom in/out
+  R - Reset zoom and pan
+  M - Toggle mouse cursor visibility
+  Q - Force cleanup all windows
+  H - Show this help
+
+Comparison Mode:
+  - Two images are overlaid
+  - Move mouse left/right to control split line
+  - Left side shows top image, right side shows bottom image
+
+Zoom and Pan:
+  - Mouse wheel: zoom in/out
+  - Left mouse drag: pan image
+  - +/- keys: zoom in/out
+  - R key: reset zoom and pan"""
+
+# Console messages are queued and written by a daemon thread, so the window and event
+# handling never block on a console write
+_log_q = queue.SimpleQueue()
+_log_writer = None
+_log_writer_lock = Lock()
+_log_write_lock = Lock()  # keeps the writer thread and the exit flush from interleaving
+
+
+def _write_log(parts):
+    """Write parts plus everything else already queued in one console write"""
+    with _log_write_lock:
+        while True:
+            try:
+                parts.append(_log_q.get_nowait())
+            except queue.Empty:
+                break
+        if parts:
+            sys.stderr.write("".join(parts))
+            sys.stderr.flush()
+
+
+def _log_writer_loop():
+    while True:
+        # Blocks until a message arrives; the thread never wakes while the console is quiet
+        _write_log([_log_q.get()])
+
+
+@atexit.register
+def _flush_log():
+    # The daemon writer may not get scheduled again once the interpreter is exiting
+    _write_log([])
+
+
+def _log(message):
+    """Queue a console line for the log writer thread"""
+    global _log_writer
+    _log_q.put(message + "\n")
+    if _log_writer is None:
+        with _log_writer_lock:
+            if _log_writer is None:
+                _log_writer = Thread(target=_log_writer_loop, name="PreviewMonitorLog", daemon=True)
+                _log_writer.start()
+
+
+# Per-frame / per-keystroke diagnostics; disabled unless the host enables DEBUG logging,
+# in which case the level check short-circuits before any formatting or I/O
+logger = logging.getLogger(__name__)
+
+
+def _init_pygame():
+    """pygame.init(), minus the joystick and mixer subsystems the preview window never uses.
+
+    With them shut down SDL stops polling gamepads and audio devices and never queues their
+    (hot-plug, axis, device-change) events.
+    """
+    pygame.init()
+    pygame.joystick.quit()
+    pygame.mixer.quit()
+
+
+def _run_in_bands(height, fn):
+    """Call fn(y0, y1) over horizontal bands covering [0, height), in parallel for tall images"""
+    if height < _BAND_MIN_ROWS:
+        fn(0, height)
+        return
+    step = -(-height // _BAND_COUNT)
+    futures = [_band_pool.submit(fn, y0, min(height, y0 + step)) for y0 in range(0, height, step)]
+    for future in futures:
+        future.result()  # re-raises anything a band hit
+
 
 class PreviewImageMonitor:
     """
     Display an image in a persistent fullscreen window on a selected monitor.
     Live updates every prompt, supports multiple fit modes (Nuke style).
     """
-    _windows = {}  # monitor_idx -> {"thread": Thread, "images": [PIL.Image], "current_idx": int, "lock": Lock, "visible": bool, "display_mode": str, "compare_image": [PIL.Image], "zoom": float, "pan_x": float, "pan_y": float}
+    # monitor_idx -> WindowState. Switching monitors closes the previous window, so this holds at
+    # most one entry, and each window thread only ever reads its own record (one slotted object,
+    # snapshotted under its lock) -- there is no cross-window scan to lay out as parallel arrays
+    _windows = {}
+    _resize_cache = OrderedDict()  # (id(source), new_w, new_h, resample) -> (source, resized); LRU of resized images
+    _cv2_interpolation = {Image.LANCZOS: cv2.INTER_LANCZOS4, Image.BILINEAR: cv2.INTER_LINEAR, Image.NEAREST: cv2.INTER_NEAREST} if CV2_AVAILABLE else {}
+    # Render quality ladder for frames drawn while interacting, best first (a settled frame is always
+    # LANCZOS at full size). The window steps down while the achievable frame rate (frames per
+    # second of busy time, over consecutive paced frames) stays under 0.7x the target and back up above 1.2x
+    _quality_tiers = ("high", "low", "min")
+    _quality_step_frames = 120  # frames the condition must hold before changing tier
+    _min_tier_scale = 0.75  # comparison render scale at the "min" tier
+    _viewport_pad = 128  # px kept around the visible part of an oversized resize
+    _viewport_grid = 128  # viewport rects are snapped to this grid so they repeat across small pans
+    _interaction_settle_ns = 100_000_000  # after the last zoom/pan/split input, before the LANCZOS re-render
+    _pacing_spin_ns = 500_000  # final stretch of a pacing sleep spun out, since OS sleeps overshoot
+    _numba_zoom = NUMBA_AVAILABLE  # cleared for the session if the bilinear kernel fails to compile or run
+    _resize_cache_lock = Lock()
+    _resize_cache_size = 8
+    _lut_cache = OrderedDict()  # (gain, gamma) -> read-only uint8[256] tone LUT
+    _lut_cache_lock = Lock()
+    _lut_cache_size = 16
 
     def __init__(self):
         if PYGAME_AVAILABLE and not pygame.get_init():
-            pygame.init()
+            _init_pygame()
     
     @classmethod
     def cleanup_all_windows(cls):
         """Clean up all windows and reset pygame state"""
         if cls._windows:
-            print("Preview Monitor: Cleaning up all windows")
+            _log("Preview Monitor: Cleaning up all windows")
             for display_idx in list(cls._windows.keys()):
                 try:
-                    with cls._windows[display_idx]["lock"]:
-                        cls._windows[display_idx]["running"] = False
-                    cls._windows[display_idx]["thread"].join(timeout=1.0)
+                    state = cls._windows[display_idx]
+                    with state.lock:
+                        state.running = False
+                    cls._wake_window()
+                    if state.thread is not None:
+                        state.thread.join(timeout=1.0)
                     del cls._windows[display_idx]
                 except Exception as e:
-                    print(f"Preview Monitor: Error cleaning up window {display_idx}: {e}")
+                    _log(f"Preview Monitor: Error cleaning up window {display_idx}: {e}")
             cls._windows.clear()
+        with cls._resize_cache_lock:
+            cls._resize_cache.clear()
+        with cls._lut_cache_lock:
+            cls._lut_cache.clear()
         
         if PYGAME_AVAILABLE and pygame.get_init():
             try:
                 pygame.quit()
-                print("Preview Monitor: Pygame quit")
+                _log("Preview Monitor: Pygame quit")
             except Exception as e:
-                print(f"Preview Monitor: Error quitting pygame: {e}")
+                _log(f"Preview Monitor: Error quitting pygame: {e}")
+
+    @staticmethod
+    def _wake_window():
+        """Post a wake-up event so a window loop blocked in pygame.event.wait() picks up new state"""
+        try:
+            pygame.event.post(pygame.event.Event(_WAKE_EVENT))
+        except pygame.error:
+            pass  # no display yet, nothing is waiting
 
     @classmethod
     def INPUT_TYPES(cls):
@@ -107,7 +369,7 @@ class PreviewImageMonitor:
 
     def display_image(self, images, monitor, power_state="On", display_mode="single", fit_mode="fit", target_resolution="1920x1080", gain=1.0, gamma=1.0, saturation=1.0, white_matte=False, fps_mode="smart", compare_image=None):
         if not PYGAME_AVAILABLE:
-            print("pygame not available, cannot display preview.")
+            _log("pygame not available, cannot display preview.")
             return (images,)
 
         # Determine monitor index
@@ -127,215 +389,217 @@ class PreviewImageMonitor:
         if self._windows and power_state == "On":
             for existing_idx in list(self._windows.keys()):
                 if existing_idx != display_idx:
-                    print(f"Preview Monitor: Switching to {monitor}. Powering off previous monitor.")
+                    _log(f"Preview Monitor: Switching to {monitor}. Powering off previous monitor.")
                     # Power off the window on the old monitor
-                    with self._windows[existing_idx]["lock"]:
-                        self._windows[existing_idx]["running"] = False
-                    self._windows[existing_idx]["thread"].join(timeout=0.5)
+                    old_state = self._windows[existing_idx]
+                    with old_state.lock:
+                        old_state.running = False
+                    self._wake_window()
+                    if old_state.thread is not None:
+                        old_state.thread.join(timeout=0.5)
                     del self._windows[existing_idx]
-                    print(f"Preview Monitor: Previous monitor {existing_idx} closed. Creating window on monitor {display_idx}.")
+                    _log(f"Preview Monitor: Previous monitor {existing_idx} closed. Creating window on monitor {display_idx}.")
         # --- END MONITOR SWITCH SAFETY ---
 
         if power_state == "Off":
             # Gracefully shut down pygame for this monitor
             if display_idx in self._windows:
                 # Set running flag to False and wait for thread to terminate
-                with self._windows[display_idx]["lock"]:
-                    self._windows[display_idx]["running"] = False
+                state = self._windows[display_idx]
+                with state.lock:
+                    state.running = False
+                self._wake_window()
                 # Wait for thread to finish
-                self._windows[display_idx]["thread"].join(timeout=0.5)
+                if state.thread is not None:
+                    state.thread.join(timeout=0.5)
                 # Clean up the window entry
                 del self._windows[display_idx]
                 # Don't quit pygame completely to allow new windows
             return (images,)
 
-        # Convert tensor to PIL Images
-        pil_images = []
-        for image in images:
-            if hasattr(image, 'cpu'):
-                # PyTorch tensor
-                image = 255.0 * image.cpu().numpy()
-            elif hasattr(image, 'numpy'):
-                # TensorFlow tensor
-                image = 255.0 * image.numpy()
-            else:
-                # Already numpy array
-                image = 255.0 * image
-            
-            # Ensure correct shape for PIL Image
-            if len(image.shape) == 4:
-                # Remove batch dimension if present
-                image = image.squeeze(0)
-            if len(image.shape) == 3 and image.shape[2] == 3:
-                # Ensure correct channel order (height, width, channels)
-                pass
-            else:
-                raise ValueError(f"Unsupported image shape: {image.shape}")
-            
-            pil_img = Image.fromarray(np.clip(image, 0, 255).astype(np.uint8))
-            # Apply image adjustments
-            adjusted_img = self._apply_image_adjustments(pil_img, gain, gamma, saturation)
-            pil_images.append(adjusted_img)
+        # Convert tensor to PIL Images (whole batch in one conversion)
+        pil_images = self._prepare_images(images, gain, gamma, saturation)
         
         # Process compare images if provided
         compare_pil_images = []
         if compare_image is not None:
-            for image in compare_image:
-                if hasattr(image, 'cpu'):
-                    # PyTorch tensor
-                    image = 255.0 * image.cpu().numpy()
-                elif hasattr(image, 'numpy'):
-                    # TensorFlow tensor
-                    image = 255.0 * image.numpy()
-                else:
-                    # Already numpy array
-                    image = 255.0 * image
-                
-                # Ensure correct shape for PIL Image
-                if len(image.shape) == 4:
-                    # Remove batch dimension if present
-                    image = image.squeeze(0)
-                if len(image.shape) == 3 and image.shape[2] == 3:
-                    # Ensure correct channel order (height, width, channels)
-                    pass
-                else:
-                    raise ValueError(f"Unsupported image shape: {image.shape}")
-                
-                pil_img = Image.fromarray(np.clip(image, 0, 255).astype(np.uint8))
-                adjusted_img = self._apply_image_adjustments(pil_img, gain, gamma, saturation)
-                compare_pil_images.append(adjusted_img)
+            compare_pil_images = self._prepare_images(compare_image, gain, gamma, saturation)
 
         # Create persistent window if it doesn't exist
         if display_idx not in self._windows:
-            print(f"Preview Monitor: Creating window on monitor {display_idx}")
-            lock = Lock()
-            self._windows[display_idx] = {
-                "images": pil_images,
-                "current_idx": 0,
-                "lock": lock,
-                "visible": True,
-                "running": True,
-                "display_mode": display_mode,
-                "compare_image": compare_pil_images,
-                "fit_mode": fit_mode,
-                "res_w": res_w,
-                "res_h": res_h,
-                "gain": gain,
-                "gamma": gamma,
-                "saturation": saturation,
-                "white_matte": white_matte,
-                "fps_mode": fps_mode,
-                "zoom": 1.0,
-                "pan_x": 0.0,
-                "pan_y": 0.0,
-                "last_image_hash": None,
-                "last_fit_mode": fit_mode,
-                "last_white_matte": white_matte
-            }
+            _log(f"Preview Monitor: Creating window on monitor {display_idx}")
+            self._windows[display_idx] = WindowState(
+                images=pil_images,
+                compare_image=compare_pil_images,
+                display_mode=display_mode,
+                fit_mode=fit_mode,
+                res_w=res_w,
+                res_h=res_h,
+                gain=gain,
+                gamma=gamma,
+                saturation=saturation,
+                white_matte=white_matte,
+                fps_mode=fps_mode,
+                last_fit_mode=fit_mode,
+                last_white_matte=white_matte,
+            )
             try:
                 t = Thread(target=self._window_loop, args=(display_idx, res_w, res_h, fit_mode), daemon=True)
-                self._windows[display_idx]["thread"] = t
+                self._windows[display_idx].thread = t
                 t.start()
-                print(f"Preview Monitor: Window thread started for monitor {display_idx}")
+                _log(f"Preview Monitor: Window thread started for monitor {display_idx}")
             except Exception as e:
-                print(f"Preview Monitor: Error creating window on monitor {display_idx}: {e}")
+                _log(f"Preview Monitor: Error creating window on monitor {display_idx}: {e}")
                 del self._windows[display_idx]
         else:
             # Update the images and ensure window is visible
-            with self._windows[display_idx]["lock"]:
-                self._windows[display_idx]["images"] = pil_images
-                self._windows[display_idx]["compare_image"] = compare_pil_images
-                self._windows[display_idx]["display_mode"] = display_mode
-                self._windows[display_idx]["visible"] = True
-                self._windows[display_idx]["fit_mode"] = fit_mode
-                self._windows[display_idx]["res_w"] = res_w
-                self._windows[display_idx]["res_h"] = res_h
-                self._windows[display_idx]["gain"] = gain
-                self._windows[display_idx]["gamma"] = gamma
-                self._windows[display_idx]["saturation"] = saturation
-                self._windows[display_idx]["white_matte"] = white_matte
-                self._windows[display_idx]["fps_mode"] = fps_mode
+            state = self._windows[display_idx]
+            with state.lock:
+                state.images = pil_images
+                state.compare_image = compare_pil_images
+                state.revision += 1
+                state.scale_cache["key"] = None
+                state.display_mode = display_mode
+                state.visible = True
+                state.fit_mode = fit_mode
+                state.res_w = res_w
+                state.res_h = res_h
+                state.gain = gain
+                state.gamma = gamma
+                state.saturation = saturation
+                state.white_matte = white_matte
+                state.fps_mode = fps_mode
+            self._wake_window()
 
         return (images,)
 
-    def _apply_image_adjustments(self, pil_img, gain, gamma, saturation):
-        """Apply gain, gamma, and saturation adjustments to the image"""
-        if gain == 1.0 and gamma == 1.0 and saturation == 1.0:
-            return pil_img  # No adjustments needed
-            
-        img_array = np.array(pil_img).astype(np.float32) / 255.0
-        
-        # Apply gain (exposure)
+    def _prepare_images(self, images, gain, gamma, saturation):
+        """Convert a BxHxWx3 [0, 1] batch to adjusted PIL Images, converting the whole batch at once"""
+        if getattr(images, 'is_cuda', False):
+            # CUDA tensor: do the pixel math on the device and copy only uint8 back
+            batch = self._prepare_frame_gpu(images, gain, gamma, saturation)
+        else:
+            batch = self._apply_image_adjustments(self._tensor_to_uint8(images), gain, gamma, saturation)
+        # Each frame of the contiguous batch is itself contiguous, so fromarray needs no extra copy
+        return [Image.fromarray(frame) for frame in batch]
+
+    def _prepare_frame_gpu(self, image, gain, gamma, saturation):
+        """Apply gain, gamma and saturation to a [0, 1] CUDA tensor and return a BxHxWx3 uint8 array"""
+        x = image.float()
+        if gain != 1.0 or gamma != 1.0:
+            x = x.mul(gain).clamp_(min=0.0).pow_(1.0 / gamma)
+        x = x.mul(255.0)
+        if saturation != 1.0:
+            # Same BT.601 luma blend as the CPU path
+            luma = (x[..., 0:1] * 0.299 + x[..., 1:2] * 0.587 + x[..., 2:3] * 0.114)
+            x = x.sub_(luma).mul_(saturation).add_(luma)
+        image = x.clamp_(0, 255).byte().cpu().numpy()
+        return self._ensure_bhwc(image)
+
+    def _tensor_to_uint8(self, image):
+        """Convert a [0, 1] image batch tensor/array to a contiguous BxHxWx3 uint8 array"""
+        if hasattr(image, 'cpu'):
+            # PyTorch tensor: quantize on the tensor's device so only uint8 data crosses to the host
+            image = image.mul(255.0).clamp_(0, 255).byte().cpu().numpy()
+        else:
+            if hasattr(image, 'numpy'):
+                # TensorFlow tensor
+                image = image.numpy()
+            # Scale into a fresh buffer, then clip it in place before the uint8 cast
+            image = np.multiply(image, 255.0)
+            np.clip(image, 0, 255, out=image)
+            image = image.astype(np.uint8)
+        return self._ensure_bhwc(image)
+
+    @staticmethod
+    def _ensure_bhwc(image):
+        """Validate a uint8 image array as BxHxWx3 (adding the batch axis for a single image) and make it contiguous"""
+        if image.ndim == 3:
+            image = image[None]
+        if image.ndim != 4 or image.shape[3] != 3:
+            raise ValueError(f"Unsupported image shape: {image.shape}")
+        return np.ascontiguousarray(image)
+
+    def _apply_image_adjustments(self, img_array, gain, gamma, saturation):
+        """Apply gain, gamma, and saturation adjustments to a uint8 RGB array (any leading shape)"""
+        # Dispatch on which controls are off their default so each case does the least work
+        tone = gain != 1.0 or gamma != 1.0
+        if saturation == 1.0:
+            if not tone:
+                return img_array  # No adjustments needed
+            return self._tone_only(img_array, gain, gamma)
+        if tone:
+            return self._tone_and_saturation(img_array, gain, gamma, saturation)
+        return self._saturation_only(img_array, saturation)
+
+    def _tone_only(self, img_array, gain, gamma):
+        """Gain (exposure) and gamma depend only on the input level: one uint8 LUT gather"""
+        lut = self._get_tone_lut(gain, gamma)
+        if CV2_AVAILABLE and img_array.flags.c_contiguous:
+            # cv2.LUT takes at most 3 dims; fold the batch into rows of one tall image
+            flat = img_array.reshape(-1, img_array.shape[-2], img_array.shape[-1])
+            return cv2.LUT(flat, lut).reshape(img_array.shape)
+        return lut[img_array]
+
+    def _saturation_only(self, img_array, saturation):
+        return self._saturation_blend(img_array.astype(np.float32), saturation)
+
+    def _tone_and_saturation(self, img_array, gain, gamma, saturation):
+        # Gather through a float32 copy of the LUT so the tone step lands directly in the
+        # blend's working buffer instead of going through a uint8 intermediate
+        rgb = self._get_tone_lut(gain, gamma).astype(np.float32)[img_array]
+        return self._saturation_blend(rgb, saturation)
+
+    @staticmethod
+    def _saturation_blend(rgb, saturation):
+        """Scale float32 RGB (modified in place) away from its BT.601 luma and return it as uint8"""
+        # Apply saturation as a blend against luma instead of an HSV round-trip
+        luma = (rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32))[..., None]
+        rgb -= luma
+        rgb *= saturation
+        rgb += luma
+        np.clip(rgb, 0.0, 255.0, out=rgb)
+        return rgb.astype(np.uint8)
+
+    @classmethod
+    def _get_tone_lut(cls, gain, gamma):
+        """Return the fused gain/gamma LUT, building it only when the parameters change"""
+        key = (gain, gamma)
+        with cls._lut_cache_lock:
+            lut = cls._lut_cache.get(key)
+            if lut is not None:
+                cls._lut_cache.move_to_end(key)
+                return lut
+
+        # Same float32 operations, in the same order, as the per-pixel pipeline the LUT replaces,
+        # so every entry is bit-identical to it
+        levels = np.arange(256, dtype=np.float32) / 255.0
         if gain != 1.0:
-            img_array = img_array * gain
-        
-        # Apply gamma
+            levels = levels * gain
         if gamma != 1.0:
-            img_array = np.power(img_array, 1.0 / gamma)
-        
-        # Apply saturation
-        if saturation != 1.0:
-            # Convert to HSV for saturation control
-            hsv_img = np.array(pil_img.convert('HSV')).astype(np.float32) / 255.0
-            # Adjust saturation channel
-            hsv_img[:, :, 1] = np.clip(hsv_img[:, :, 1] * saturation, 0.0, 1.0)
-            # Convert back to RGB
-            hsv_img = (hsv_img * 255.0).astype(np.uint8)
-            img_array = np.array(Image.fromarray(hsv_img, 'HSV').convert('RGB')).astype(np.float32) / 255.0
-        
-        # Clip and convert back to uint8
-        img_array = np.clip(img_array, 0.0, 1.0) * 255.0
-        return Image.fromarray(img_array.astype(np.uint8))
-
-    def _create_comparison_image(self, img1, img2, target_w, target_h, mode, white_matte=False, mouse_x=None, zoom=1.0, pan_x=0.0, pan_y=0.0):
-        """Create an overlay comparison image with mouse-controlled split"""
-        if img1 is None or img2 is None:
-            return self._scale_image(img1 or img2, target_w, target_h, mode, white_matte, zoom, pan_x, pan_y)
-        
-        # Scale both images to full size
-        scaled_img1 = self._scale_image(img1, target_w, target_h, mode, white_matte, zoom, pan_x, pan_y)
-        scaled_img2 = self._scale_image(img2, target_w, target_h, mode, white_matte, zoom, pan_x, pan_y)
-        
-        # If no mouse position, show side-by-side as fallback
-        if mouse_x is None:
-            mouse_x = target_w // 2
-        
-        # Ensure mouse_x is within bounds
-        mouse_x = max(0, min(mouse_x, target_w))
-        
-        # Convert to numpy arrays for faster processing
-        img1_array = np.array(scaled_img1)
-        img2_array = np.array(scaled_img2)
-        
-        # Create result array more efficiently
-        # Create a mask for the split line
-        mask = np.arange(target_w)[None, :] < mouse_x
-        # Expand mask to match image dimensions
-        mask_3d = np.stack([mask] * target_h, axis=0)
-        if len(img1_array.shape) == 3:
-            mask_3d = np.stack([mask_3d] * img1_array.shape[2], axis=2)
-        
-        result_array = np.where(mask_3d, img1_array, img2_array)
-        
-        # Add vertical line more efficiently
-        line_color = (255, 255, 0) if not white_matte else (0, 0, 0)
-        if 0 < mouse_x < target_w:
-            result_array[:, mouse_x-1:mouse_x+1] = line_color
-        
-        return Image.fromarray(result_array)
+            levels = np.power(levels, 1.0 / gamma)
+        lut = (np.clip(levels, 0.0, 1.0) * 255.0).astype(np.uint8)
+        lut.flags.writeable = False  # shared between callers
+
+        with cls._lut_cache_lock:
+            cls._lut_cache[key] = lut
+            while len(cls._lut_cache) > cls._lut_cache_size:
+                cls._lut_cache.popitem(last=False)
+        return lut
 
-    def _scale_image(self, pil_img, target_w, target_h, mode, white_matte=False, zoom=1.0, pan_x=0.0, pan_y=0.0):
+    def _scale_image(self, pil_img, target_w, target_h, mode, zoom=1.0, pan_x=0.0, pan_y=0.0, resample=Image.LANCZOS):
+        """Resize pil_img for the fit mode and zoom.
+
+        Returns ``(resized, x, y)`` where (x, y) is the top-left paste position inside
+        the target area; the caller blits it, so no full-size canvas is built here.
+        """
         img_w, img_h = pil_img.size
-        # Use white background if white_matte is enabled, otherwise black
-        bg_color = (255, 255, 255) if white_matte else (0, 0, 0)
-        canvas = Image.new("RGB", (target_w, target_h), bg_color)
 
         if mode == "none" or mode == "center":
             # Keep original size, center it
             x = (target_w - img_w) // 2
             y = (target_h - img_h) // 2
-            canvas.paste(pil_img, (x, y))
-            return canvas
+            return pil_img, x, y
 
         if mode == "width":
             scale = target_w / img_w
@@ -363,38 +627,228 @@ class PreviewImageMonitor:
             new_w = int(new_w * zoom)
             new_h = int(new_h * zoom)
 
-        resized = pil_img.resize((new_w, new_h), Image.LANCZOS)
-        
         # Calculate position with pan offset
         x = (target_w - new_w) // 2 + int(pan_x)
         y = (target_h - new_h) // 2 + int(pan_y)
-        
-        # Only paste if the image is visible within the canvas
-        if x < target_w and y < target_h and x + new_w > 0 and y + new_h > 0:
-            # Crop the image if it goes outside the canvas
-            crop_x1 = max(0, -x)
-            crop_y1 = max(0, -y)
-            crop_x2 = min(new_w, target_w - x)
-            crop_y2 = min(new_h, target_h - y)
-            
-            if crop_x2 > crop_x1 and crop_y2 > crop_y1:
-                cropped = resized.crop((crop_x1, crop_y1, crop_x2, crop_y2))
-                paste_x = max(0, x)
-                paste_y = max(0, y)
-                canvas.paste(cropped, (paste_x, paste_y))
-        
-        return canvas
 
-    def _get_image_hash(self, pil_img):
-        """Generate a hash for the image to detect changes"""
-        if pil_img is None:
+        if new_w <= target_w and new_h <= target_h:
+            # Pan only moves the paste offset, so the resize itself is cacheable
+            return self._resize_only(pil_img, new_w, new_h, resample), x, y
+
+        # The scaled image is bigger than the target (zoomed in, or fill): only resample the
+        # visible part, padded and snapped to a grid so small pans keep hitting the cache
+        pad, grid = self._viewport_pad, self._viewport_grid
+        vis_x0, vis_x1 = max(0, -x), min(new_w, target_w - x)
+        vis_y0, vis_y1 = max(0, -y), min(new_h, target_h - y)
+        if vis_x1 <= vis_x0 or vis_y1 <= vis_y0:
+            # Panned completely out of view
+            return Image.new("RGB", (1, 1)), target_w, target_h
+        rx0 = max(0, (vis_x0 - pad) // grid * grid)
+        ry0 = max(0, (vis_y0 - pad) // grid * grid)
+        rx1 = min(new_w, -(-(vis_x1 + pad) // grid) * grid)
+        ry1 = min(new_h, -(-(vis_y1 + pad) // grid) * grid)
+        region = None if (rx0, ry0, rx1, ry1) == (0, 0, new_w, new_h) else (rx0, ry0, rx1, ry1)
+        resized = self._resize_only(pil_img, new_w, new_h, resample, region)
+        if region is None:
+            return resized, x, y
+        return resized, x + rx0, y + ry0
+
+    def _scale_into(self, pil_img, canvas, mode, bg_color, zoom=1.0, pan_x=0.0, pan_y=0.0, resample=Image.LANCZOS):
+        """Scale pil_img and render it into canvas, a reusable (H, W, 3) uint8 array (used for compositing)"""
+        target_h, target_w = canvas.shape[:2]
+        resized, x, y = self._scale_image(pil_img, target_w, target_h, mode, zoom, pan_x, pan_y, resample)
+        return self._paste_into(resized, canvas, x, y, bg_color)
+
+    def _resize_only(self, pil_img, new_w, new_h, resample=Image.LANCZOS, region=None):
+        """Resize pil_img, reusing the result while the same source, size and filter are requested.
+
+        A cheaper ``resample`` (used while interacting) is also satisfied by a cached LANCZOS result.
+        ``region`` is an optional (x0, y0, x1, y1) rect in resized coordinates; only that part of
+        the new_w x new_h result is produced.
+        """
+        if (new_w, new_h) == pil_img.size and region is None:
+            return pil_img  # 1:1, nothing to resample
+
+        # The cache holds a reference to the source, so its id() cannot be recycled while cached
+        key = (id(pil_img), new_w, new_h, resample, region)
+        lanczos_key = (id(pil_img), new_w, new_h, Image.LANCZOS, region)
+        with self._resize_cache_lock:
+            for k in (lanczos_key, key):
+                entry = self._resize_cache.get(k)
+                if entry is not None and entry[0] is pil_img:
+                    self._resize_cache.move_to_end(k)
+                    return entry[1]
+
+        # For big downscales, box-reduce by an integer factor first so the filter runs on
+        # an image at most ~4x the target; the remaining >=2x step keeps the quality
+        img_w, img_h = pil_img.size
+        k = min(img_w // max(1, new_w), img_h // max(1, new_h)) // 2
+        source = pil_img.reduce(k) if k >= 2 else pil_img
+        resized = None
+        if (self._numba_zoom and resample == Image.BILINEAR and source.mode == "RGB"
+                and new_w >= source.width and new_h >= source.height):
+            # Zoomed-in draft frames: banded bilinear over just the requested region
+            resized = self._numba_bilinear(source, new_w, new_h, region)
+        if resized is None:
+            if region is not None:
+                # PIL resamples just the source box that maps onto the region (sub-pixel exact)
+                rx0, ry0, rx1, ry1 = region
+                sx, sy = source.width / new_w, source.height / new_h
+                resized = source.resize((rx1 - rx0, ry1 - ry0), resample, box=(rx0 * sx, ry0 * sy, rx1 * sx, ry1 * sy))
+            elif CV2_AVAILABLE and source.mode == "RGB" and resample in self._cv2_interpolation:
+                # OpenCV's SIMD resize; PIL stays the transport format for the cache and callers.
+                # cv2's LANCZOS4/LINEAR kernels don't widen when shrinking and alias, so any
+                # downscale (the 1x-4x left after reduce()) goes through INTER_AREA instead
+                interpolation = self._cv2_interpolation[resample]
+                if resample != Image.NEAREST and (new_w < source.width or new_h < source.height):
+                    interpolation = cv2.INTER_AREA
+                resized = Image.fromarray(cv2.resize(np.asarray(source), (new_w, new_h), interpolation=interpolation))
+            else:
+                resized = source.resize((new_w, new_h), resample)
+
+        with self._resize_cache_lock:
+            self._resize_cache[key] = (pil_img, resized)
+            self._resize_cache.move_to_end(key)
+            while len(self._resize_cache) > self._resize_cache_size:
+                self._resize_cache.popitem(last=False)
+        return resized
+
+    @classmethod
+    def _numba_bilinear(cls, source, new_w, new_h, region=None):
+        """Bilinear magnification with _bilinear_zoom, or None (and PIL from then on) if numba fails"""
+        rx0, ry0, rx1, ry1 = region if region is not None else (0, 0, new_w, new_h)
+        out = np.empty((ry1 - ry0, rx1 - rx0, 3), dtype=np.uint8)
+        src = np.asarray(source)
+        scale_x, scale_y = source.width / new_w, source.height / new_h
+
+        def zoom_band(y0, y1):
+            _bilinear_zoom(src, out[y0:y1], rx0, ry0 + y0, scale_x, scale_y)
+
+        try:
+            _run_in_bands(out.shape[0], zoom_band)
+        except Exception as e:
+            cls._numba_zoom = False
+            _log(f"Preview Monitor: numba zoom kernel unavailable ({e}), using PIL resize")
             return None
-        return hashlib.md5(pil_img.tobytes()).hexdigest()
+        return Image.fromarray(out)
+
+    def _paste_into(self, resized, canvas, x, y, bg_color):
+        """Copy the part of resized that lands inside canvas at (x, y) and fill the rest with bg_color"""
+        target_h, target_w = canvas.shape[:2]
+        new_w, new_h = resized.size
+
+        for rx, ry, rw, rh in self._letterbox_rects(x, y, new_w, new_h, target_w, target_h):
+            canvas[ry:ry + rh, rx:rx + rw] = bg_color
+
+        # Crop the image if it goes outside the canvas
+        crop_x1 = max(0, -x)
+        crop_y1 = max(0, -y)
+        crop_x2 = min(new_w, target_w - x)
+        crop_y2 = min(new_h, target_h - y)
+
+        if crop_x2 > crop_x1 and crop_y2 > crop_y1:
+            if resized.mode != "RGB":
+                resized = resized.convert("RGB")
+            paste_x = max(0, x)
+            paste_y = max(0, y)
+            cropped = np.asarray(resized.crop((crop_x1, crop_y1, crop_x2, crop_y2)))
+            canvas[paste_y:paste_y + cropped.shape[0], paste_x:paste_x + cropped.shape[1]] = cropped
+
+        return canvas
+
+    @staticmethod
+    def _composite_to_surface(surface, left, right, split_x, line_color):
+        """Write the split comparison of two (H, W, 3) uint8 arrays straight into a same-sized Surface.
+
+        Columns before ``split_x`` come from ``left``, the rest from ``right``: two contiguous slice
+        copies per band, with no intermediate composite array to build and upload.
+        """
+        pixels = pygame.surfarray.pixels3d(surface)  # (W, H, 3) view; locks the surface
+        src_left = left.swapaxes(0, 1)
+        src_right = right.swapaxes(0, 1)
+        try:
+            def composite_band(y0, y1):
+                pixels[:split_x, y0:y1] = src_left[:split_x, y0:y1]
+                pixels[split_x:, y0:y1] = src_right[split_x:, y0:y1]
+
+            _run_in_bands(left.shape[0], composite_band)
+            if 0 < split_x < left.shape[1]:
+                pixels[split_x - 1:split_x + 1] = line_color
+        finally:
+            del pixels  # unlock before the surface is blitted
+
+    # Key handlers, dispatched through _KEY_HANDLERS; they return True when they replaced the view
+    def _key_hide(self, state):
+        state.visible = False
+
+    def _key_step_image(self, state, step):
+        with state.lock:
+            if state.display_mode == "slideshow" and len(state.images) > 1:
+                state.current_idx = (state.current_idx + step) % len(state.images)
+                logger.debug("Showing image %d/%d", state.current_idx + 1, len(state.images))
+
+    def _key_previous_image(self, state):
+        self._key_step_image(state, -1)
+
+    def _key_next_image(self, state):
+        self._key_step_image(state, 1)
+
+    def _key_toggle_mode(self, state, mode):
+        if state.display_mode == mode:
+            state.display_mode = "single"
+            _log("Preview Monitor: Switched to single image mode")
+        else:
+            state.display_mode = mode
+            _log(f"Preview Monitor: Switched to {mode} mode")
+
+    def _key_toggle_comparison(self, state):
+        self._key_toggle_mode(state, "comparison")
+
+    def _key_toggle_slideshow(self, state):
+        self._key_toggle_mode(state, "slideshow")
+
+    def _key_reset_view(self, state):
+        if state.view != ViewState():
+            state.view = ViewState()
+        _log("Preview Monitor: Reset zoom and pan")
+        return True
+
+    def _key_toggle_mouse(self, state):
+        current_visible = pygame.mouse.get_visible()
+        pygame.mouse.set_visible(not current_visible)
+        _log(f"Preview Monitor: Mouse cursor {'shown' if not current_visible else 'hidden'}")
+
+    def _key_cleanup_all(self, state):
+        self.cleanup_all_windows()
+        _log("Preview Monitor: All windows cleaned up")
+
+    def _key_help(self, state):
+        _log(_HELP_TEXT)
+
+    @staticmethod
+    def _letterbox_rects(x, y, w, h, target_w, target_h):
+        """Return the (up to four) screen rects not covered by an image blitted at (x, y) with size (w, h)"""
+        top = max(0, min(y, target_h))
+        bottom = max(top, min(y + h, target_h))
+        left = max(0, min(x, target_w))
+        right = max(left, min(x + w, target_w))
+        rects = [
+            (0, 0, target_w, top),  # top bar
+            (0, bottom, target_w, target_h - bottom),  # bottom bar
+            (0, top, left, bottom - top),  # left bar
+            (right, top, target_w - right, bottom - top),  # right bar
+        ]
+        return [r for r in rects if r[2] > 0 and r[3] > 0]
 
     def _window_loop(self, display_idx, res_w, res_h, fit_mode):
+        # Hold on to this window's state before the (possibly slow) window creation and kernel
+        # warm-up: display_image may power the window off and drop its _windows entry meanwhile,
+        # and the loop must still see running=False and close the display
+        state = self._windows[display_idx]
+
         # Ensure pygame is initialized
         if PYGAME_AVAILABLE and not pygame.get_init():
-            pygame.init()
+            _init_pygame()
         
         # Determine monitor position
         if SCREENINFO_AVAILABLE:
@@ -408,46 +862,104 @@ class PreviewImageMonitor:
 
         try:
             os.environ["SDL_VIDEO_WINDOW_POS"] = f"{mon_x},{mon_y}"
-            screen = pygame.display.set_mode((res_w, res_h), pygame.NOFRAME)
-            pygame.display.set_caption(f"Preview Monitor {display_idx} - Press H for help")
+            try:
+                # SCALED presents through SDL's GPU renderer (the final scale to the window happens
+                # on the GPU, mouse events stay in res_w x res_h coordinates); vsync needs it
+                screen = pygame.display.set_mode((res_w, res_h), pygame.NOFRAME | pygame.SCALED, vsync=1)
+            except pygame.error:
+                # No accelerated renderer (or no vsync) on this driver: plain software window
+                screen = pygame.display.set_mode((res_w, res_h), pygame.NOFRAME)
+            last_caption = f"Preview Monitor {display_idx} - Press H for help"
+            pygame.display.set_caption(last_caption)
             pygame.mouse.set_visible(True)  # Show mouse cursor
-            clock = pygame.time.Clock()
-            print(f"Preview Monitor: Window created successfully on monitor {display_idx} at position ({mon_x}, {mon_y})")
+            # Only queue the events the loop handles, so event.wait() is not woken by noise
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                                      pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.VIDEORESIZE, _WAKE_EVENT])
+            _log(f"Preview Monitor: Window created successfully on monitor {display_idx} at position ({mon_x}, {mon_y})")
         except Exception as e:
-            print(f"Preview Monitor: Error creating window on monitor {display_idx}: {e}")
+            _log(f"Preview Monitor: Error creating window on monitor {display_idx}: {e}")
             return
 
-        # Initialize last rendered image
+        if self._numba_zoom:
+            # Compile the draft zoom kernel now, through the same guarded call _resize_only uses,
+            # rather than stalling the first zoom interaction
+            self._numba_bilinear(Image.new("RGB", (2, 2)), 4, 4)
+
+        # Initialize last rendered image and where it is blitted
         last_rendered_image = None
+        last_rendered_pos = (0, 0)
+        # Surface for the most recent resized image, so an unchanged resize is not re-encoded
+        surface_source = None
+        surface_cached = None
+        last_layout = None  # (pos, size, res_w, res_h, bg_color) the background was last cleared for
+        comparison_canvases = None  # reused (res_h, res_w, 3) buffers the two compared images are rendered into
+        comparison_canvas_key = None  # inputs the canvases were last rendered for; the split line is not part of it
+        comparison_surface = None  # persistent Surface the composite is written into
         running = True
         mouse_x = res_w // 2  # Default split position
         dragging = False
+        last_interaction_ns = 0  # frame clock (work_start_ns) of the last zoom/pan/split input
+        rendered_draft = False  # last frame was rendered with the fast interactive filter
         last_mouse_pos = (0, 0)
-        last_mouse_update = 0  # For mouse movement throttling
-        mouse_throttle_interval = 16  # ~60fps for mouse updates (16ms)
-        frame_count = 0
-        last_fps_time = 0
-        performance_mode = "normal"  # normal, high_performance, low_latency
+        # Frame pacing: per-frame work time (ns, excluding the pacing sleep) is smoothed with an
+        # EMA and extrapolated with a quadratic fit, and the sleep is the frame period minus the
+        # predicted work of the next frame
+        work_samples = deque(maxlen=60)
+        work_ema_ns = 0.0
+        work_fit = None  # polyfit coefficients over work_samples, refreshed every 30 frames
+        work_fit_len = 0
+        frames_since_fit = 0
+        # The one clock read per frame, taken after pacing; it also times input and the draft filter
+        work_start_ns = time.perf_counter_ns()
+        # Per-second accounting of consecutive paced frames and their busy time, for the quality
+        # tiers; None while idle, started by the next paced frame
+        window_start_ns = None
+        window_frames = 0
+        window_busy_ns = 0
+        slow_frames = fast_frames = 0
         
         while running:
-            # Check if we should continue running
-            with self._windows[display_idx]["lock"]:
-                if not self._windows[display_idx]["running"]:
+            # Snapshot the shared state and record what this frame is rendering
+            # in one critical section; the rest of the frame works off locals
+            with state.lock:
+                if not state.running:
                     running = False
                     break
-                images = self._windows[display_idx]["images"]
-                current_idx = self._windows[display_idx]["current_idx"]
-                display_mode = self._windows[display_idx]["display_mode"]
-                compare_image = self._windows[display_idx]["compare_image"]
-                visible = self._windows[display_idx]["visible"]
-                current_fit_mode = self._windows[display_idx].get("fit_mode", fit_mode)
-                res_w = self._windows[display_idx].get("res_w", res_w)
-                res_h = self._windows[display_idx].get("res_h", res_h)
-                white_matte = self._windows[display_idx].get("white_matte", False)
-                fps_mode = self._windows[display_idx].get("fps_mode", "smart")
-                zoom = self._windows[display_idx].get("zoom", 1.0)
-                pan_x = self._windows[display_idx].get("pan_x", 0.0)
-                pan_y = self._windows[display_idx].get("pan_y", 0.0)
+                images = state.images
+                current_idx = state.current_idx
+                display_mode = state.display_mode
+                compare_image = state.compare_image
+                visible = state.visible
+                current_fit_mode = state.fit_mode
+                res_w = state.res_w
+                res_h = state.res_h
+                white_matte = state.white_matte
+                fps_mode = state.fps_mode
+                view = state.view
+                zoom, pan_x, pan_y = view
+                revision = state.revision
+
+                settings_changed = image_changed = mouse_changed = False
+                if visible and images:
+                    settings_changed = (current_fit_mode != state.last_fit_mode or
+                                        white_matte != state.last_white_matte or
+                                        display_mode != state.last_display_mode or
+                                        current_idx != state.last_current_idx or
+                                        view != state.last_view)
+                    # display_image is the only writer of the images list and bumps the revision
+                    image_changed = (revision != state.last_revision)
+                    last_mouse_x = state.last_mouse_x if state.last_mouse_x is not None else res_w // 2
+                    mouse_changed = (mouse_x != last_mouse_x)
+
+                    # Update last known state
+                    state.last_revision = revision
+                    state.last_fit_mode = current_fit_mode
+                    state.last_white_matte = white_matte
+                    state.last_display_mode = display_mode
+                    state.last_current_idx = current_idx
+                    state.last_view = view
+                    state.last_mouse_x = mouse_x
 
             if not running:
                 break
@@ -460,66 +972,100 @@ class PreviewImageMonitor:
             else:  # smart mode
                 target_fps = 30  # Base rate, but smart rendering will skip work
 
-            # Fill background
             bg_color = (255, 255, 255) if white_matte else (0, 0, 0)
-            screen.fill(bg_color)
 
             needs_redraw = False
             if visible and images and len(images) > 0:
+                # Draft-quality resampling while the user is zooming/panning/moving the split
+                interacting = dragging or (work_start_ns - last_interaction_ns) < self._interaction_settle_ns
                 if fps_mode == "smart":
                     # Smart mode: Only redraw if something changed
-                    current_image = images[current_idx] if current_idx < len(images) else images[0]
-                    current_image_hash = self._get_image_hash(current_image)
-                    current_settings_hash = f"{current_fit_mode}_{white_matte}_{display_mode}_{current_idx}"
-                    
-                    # Check if we need to redraw
-                    settings_changed = (current_fit_mode != self._windows[display_idx].get("last_fit_mode") or
-                                      white_matte != self._windows[display_idx].get("last_white_matte") or
-                                      display_mode != self._windows[display_idx].get("last_display_mode") or
-                                      current_idx != self._windows[display_idx].get("last_current_idx") or
-                                      zoom != self._windows[display_idx].get("last_zoom", 1.0) or
-                                      pan_x != self._windows[display_idx].get("last_pan_x", 0.0) or
-                                      pan_y != self._windows[display_idx].get("last_pan_y", 0.0))
-                    image_changed = (current_image_hash != self._windows[display_idx].get("last_image_hash"))
-                    
-                    # In comparison mode, only redraw when necessary for better performance
                     if display_mode == "comparison":
                         # Only redraw if image, settings, or mouse position changed
-                        mouse_changed = (mouse_x != self._windows[display_idx].get("last_mouse_x", res_w // 2))
                         needs_redraw = image_changed or settings_changed or mouse_changed
                     else:
                         needs_redraw = image_changed or settings_changed
-                    
-                    # Update last known state
-                    with self._windows[display_idx]["lock"]:
-                        self._windows[display_idx]["last_image_hash"] = current_image_hash
-                        self._windows[display_idx]["last_fit_mode"] = current_fit_mode
-                        self._windows[display_idx]["last_white_matte"] = white_matte
-                        self._windows[display_idx]["last_display_mode"] = display_mode
-                        self._windows[display_idx]["last_current_idx"] = current_idx
-                        self._windows[display_idx]["last_zoom"] = zoom
-                        self._windows[display_idx]["last_pan_x"] = pan_x
-                        self._windows[display_idx]["last_pan_y"] = pan_y
-                        self._windows[display_idx]["last_mouse_x"] = mouse_x
+                    # Replace the last draft frame with a full-quality one once interaction settles
+                    needs_redraw = needs_redraw or (rendered_draft and not interacting)
                 else:
                     # Fixed FPS modes: Always redraw
                     needs_redraw = True
 
                 if needs_redraw:
                     current_image = images[current_idx] if current_idx < len(images) else images[0]
+                    # The tier only lowers the cost of interactive frames; the settled frame is full quality
+                    quality_tier = state.quality_tier if interacting else "high"
+                    if not interacting:
+                        resample = Image.LANCZOS
+                    elif quality_tier == "high":
+                        resample = Image.BILINEAR
+                    else:
+                        resample = Image.NEAREST
+                    # A draft frame is followed by a LANCZOS one once interaction settles
+                    rendered_draft = interacting
+
+                    is_comparison = display_mode == "comparison" and compare_image and len(compare_image) > 0
+                    current_compare = None
+                    if is_comparison:
+                        current_compare = compare_image[current_idx] if current_idx < len(compare_image) else compare_image[0]
+                    # Everything the rendered frame depends on; fixed-fps modes redraw every tick,
+                    # so an unchanged key reuses the Surface on screen instead of rescaling
+                    scale_key = (id(current_image), id(current_compare), res_w, res_h, current_fit_mode, white_matte,
+                                 zoom, round(pan_x, 1), round(pan_y, 1), mouse_x if is_comparison else None,
+                                 resample, quality_tier)
+                    scale_cache = state.scale_cache
                     
-                    if display_mode == "comparison" and compare_image and len(compare_image) > 0:
-                        compare_image = compare_image[current_idx] if current_idx < len(compare_image) else compare_image[0]
-                        scaled_img = self._create_comparison_image(current_image, compare_image, res_w, res_h, current_fit_mode, white_matte, mouse_x, zoom, pan_x, pan_y)
+                    if scale_key == scale_cache["key"]:
+                        last_rendered_image = scale_cache["surf"]
+                        last_rendered_pos = scale_cache["pos"]
+                    elif is_comparison:
+                        # At the min tier composite at reduced size and let SDL scale it up
+                        # (not for none/center, whose layout does not follow the target size)
+                        if quality_tier == "min" and current_fit_mode not in ("none", "center"):
+                            render_scale = self._min_tier_scale
+                        else:
+                            render_scale = 1.0
+                        comp_w, comp_h = max(1, int(res_w * render_scale)), max(1, int(res_h * render_scale))
+                        if comparison_canvases is None or comparison_canvases[0].shape != (comp_h, comp_w, 3):
+                            comparison_canvases = (np.empty((comp_h, comp_w, 3), dtype=np.uint8),
+                                                   np.empty((comp_h, comp_w, 3), dtype=np.uint8))
+                            comparison_canvas_key = None
+                        # Moving the split line only re-composites; the two scaled images are kept
+                        canvas_key = (revision, id(current_image), id(current_compare), comp_w, comp_h, current_fit_mode,
+                                      white_matte, zoom, pan_x, pan_y, resample)
+                        if canvas_key != comparison_canvas_key:
+                            bg_color = (255, 255, 255) if white_matte else (0, 0, 0)
+                            self._scale_into(current_image, comparison_canvases[0], current_fit_mode, bg_color,
+                                             zoom, pan_x * render_scale, pan_y * render_scale, resample)
+                            self._scale_into(current_compare, comparison_canvases[1], current_fit_mode, bg_color,
+                                             zoom, pan_x * render_scale, pan_y * render_scale, resample)
+                            comparison_canvas_key = canvas_key
+                        # Reallocated only on resolution change; the halves are copied straight into its pixels
+                        if comparison_surface is None or comparison_surface.get_size() != (comp_w, comp_h):
+                            comparison_surface = pygame.Surface((comp_w, comp_h), depth=32)
+                        split_x = max(0, min(int(mouse_x * render_scale), comp_w))
+                        line_color = (0, 0, 0) if white_matte else (255, 255, 0)
+                        self._composite_to_surface(comparison_surface, comparison_canvases[0], comparison_canvases[1],
+                                                   split_x, line_color)
+                        if render_scale != 1.0:
+                            last_rendered_image = pygame.transform.scale(comparison_surface, (res_w, res_h))
+                        else:
+                            last_rendered_image = comparison_surface
+                        last_rendered_pos = (0, 0)
                     else:
                         # If comparison mode is selected but no compare images available, fall back to single mode
                         if display_mode == "comparison":
-                            print("Preview Monitor: Comparison mode selected but no compare images available, falling back to single mode")
-                        scaled_img = self._scale_image(current_image, res_w, res_h, current_fit_mode, white_matte, zoom, pan_x, pan_y)
-                    
-                    if scaled_img.mode not in ("RGB", "RGBA"):
-                        scaled_img = scaled_img.convert("RGB")
-                    last_rendered_image = pygame.image.fromstring(scaled_img.tobytes(), scaled_img.size, scaled_img.mode)
+                            logger.debug("Comparison mode selected but no compare images available, falling back to single mode")
+                        resized, x_pos, y_pos = self._scale_image(current_image, res_w, res_h, current_fit_mode, zoom, pan_x, pan_y, resample)
+                        if resized is not surface_source:
+                            rgb = resized if resized.mode in ("RGB", "RGBA") else resized.convert("RGB")
+                            surface_cached = pygame.image.frombuffer(rgb.tobytes(), rgb.size, rgb.mode)
+                            surface_source = resized
+                        last_rendered_image = surface_cached
+                        last_rendered_pos = (x_pos, y_pos)
+                    scale_cache["key"] = scale_key
+                    scale_cache["surf"] = last_rendered_image
+                    scale_cache["pos"] = last_rendered_pos
                     
                     # Update window title with current status
                     status_text = f"Preview Monitor {display_idx} - {display_mode.title()}"
@@ -530,43 +1076,143 @@ class PreviewImageMonitor:
                     if zoom != 1.0:
                         status_text += f" - Zoom: {zoom:.1f}x"
                     status_text += " - Press H for help"
-                    pygame.display.set_caption(status_text)
+                    # set_caption can round-trip to the window manager, so only call it on change
+                    if status_text != last_caption:
+                        pygame.display.set_caption(status_text)
+                        last_caption = status_text
 
-                # Always blit the last rendered image if available
+                # Always blit the last rendered image if available (SDL clips off-screen parts)
                 if last_rendered_image:
-                    x_pos = (res_w - last_rendered_image.get_width()) // 2
-                    y_pos = (res_h - last_rendered_image.get_height()) // 2
-                    screen.blit(last_rendered_image, (x_pos, y_pos))
+                    screen.blit(last_rendered_image, last_rendered_pos)
 
+            # Clear only what the image does not cover, and only when that area changes
+            if visible and images and last_rendered_image:
+                layout = (last_rendered_pos, last_rendered_image.get_size(), res_w, res_h, bg_color)
+            else:
+                layout = (None, None, res_w, res_h, bg_color)
+            if layout != last_layout:
+                if layout[0] is None:
+                    screen.fill(bg_color)
+                else:
+                    for rect in self._letterbox_rects(*last_rendered_pos, *last_rendered_image.get_size(), res_w, res_h):
+                        screen.fill(bg_color, rect)
+                last_layout = layout
+
+            # Busy time ends before flip(), which may block on vsync
+            work_end_ns = time.perf_counter_ns()
             pygame.display.flip()
 
+            first_event = None
+            if fps_mode == "smart" and not needs_redraw:
+                # Idle: block in SDL until input or a wake-up from display_image. Poll faster
+                # while the full-quality redraw after an interaction is still pending
+                dirty = rendered_draft or dragging
+                first_event = pygame.event.wait(16 if dirty else 200)
+                # Quality tiers judge runs of consecutive paced frames only; an idle spell ends the run
+                window_start_ns = None
+                window_frames = 0
+                window_busy_ns = 0
+                slow_frames = fast_frames = 0
+                # Poll input at most once per frame period: the first event after a quiet spell is
+                # handled at once, a burst (mouse motion at the device's poll rate) waits out the
+                # rest of the period in SDL's queue and is taken as one batch below
+                if first_event.type != pygame.NOEVENT:
+                    remaining_ns = 1_000_000_000 // target_fps - (time.perf_counter_ns() - work_start_ns)
+                    if remaining_ns > 0:
+                        time.sleep(remaining_ns * 1e-9)
+            else:
+                # Cap the redraw rate; input queues up meanwhile
+                work_ns = work_end_ns - work_start_ns
+                work_ema_ns = 0.9 * work_ema_ns + 0.1 * work_ns if work_samples else float(work_ns)
+                work_samples.append(work_ns)
+                frames_since_fit += 1
+                if frames_since_fit >= 30 and len(work_samples) >= 3:
+                    work_fit_len = len(work_samples)
+                    work_fit = np.polyfit(np.arange(work_fit_len), np.fromiter(work_samples, dtype=np.float64, count=work_fit_len), 2)
+                    frames_since_fit = 0
+                predicted_ns = work_ema_ns
+                if work_fit is not None:
+                    # Extrapolate to the next frame; keep a runaway fit within sane bounds
+                    predicted_ns = min(max(float(np.polyval(work_fit, work_fit_len + frames_since_fit)), 0.0), 2.0 * work_ema_ns)
+                sleep_ns = int(1e9 / target_fps - predicted_ns)
+                if sleep_ns > 0:
+                    deadline_ns = work_end_ns + sleep_ns
+                    if sleep_ns > self._pacing_spin_ns:
+                        time.sleep((sleep_ns - self._pacing_spin_ns) * 1e-9)
+                    while time.perf_counter_ns() < deadline_ns:
+                        time.sleep(0)
+
+                # Quality tiers: judge each second of paced frames by the rate the work alone allows.
+                # Integer form of frames / busy_s < 0.7 * target (and > 1.2 * target):
+                # frames * 10e9 < 7 * target * busy_ns; the float rate is only built for the log line
+                if window_start_ns is None:
+                    window_start_ns = work_start_ns
+                window_frames += 1
+                window_busy_ns += work_ns
+                if work_start_ns - window_start_ns >= 1_000_000_000 and window_busy_ns > 0:
+                    scaled_frames = window_frames * 10_000_000_000
+                    if scaled_frames < 7 * target_fps * window_busy_ns:
+                        slow_frames += window_frames
+                        fast_frames = 0
+                    elif scaled_frames > 12 * target_fps * window_busy_ns:
+                        fast_frames += window_frames
+                        slow_frames = 0
+                    else:
+                        slow_frames = fast_frames = 0
+                    if slow_frames >= self._quality_step_frames and state.quality_tier != self._quality_tiers[-1]:
+                        state.quality_tier = self._quality_tiers[self._quality_tiers.index(state.quality_tier) + 1]
+                        slow_frames = 0
+                        _log(f"Preview Monitor: Lowered render quality to {state.quality_tier} ({window_frames * 1e9 / window_busy_ns:.1f} fps achievable)")
+                    elif fast_frames >= self._quality_step_frames and state.quality_tier != self._quality_tiers[0]:
+                        state.quality_tier = self._quality_tiers[self._quality_tiers.index(state.quality_tier) - 1]
+                        fast_frames = 0
+                        _log(f"Preview Monitor: Raised render quality to {state.quality_tier} ({window_frames * 1e9 / window_busy_ns:.1f} fps achievable)")
+                    window_start_ns = work_start_ns
+                    window_frames = 0
+                    window_busy_ns = 0
+            work_start_ns = time.perf_counter_ns()
+
+            # Pump once, then take the whole queue in one call
+            pygame.event.pump()
+            events = pygame.event.get(pump=False)
+            if first_event is not None and first_event.type != pygame.NOEVENT:
+                events.insert(0, first_event)
+
+            # Coalesce the batch: a run of motion events only matters for its last position
+            # (pan deltas are taken against last_mouse_pos)
+            batch = []
+            for event in events:
+                if (event.type == pygame.MOUSEMOTION and batch
+                        and batch[-1].type == pygame.MOUSEMOTION):
+                    batch[-1] = event
+                    continue
+                batch.append(event)
+
+            # Zoom key repeats / wheel ticks multiply into one factor and drag deltas are summed,
+            # in event order, so the whole batch is published in one view swap below
+            zoom_factor = 1.0
+            pan_dx = pan_dy = 0
+
             # Handle events
-            for event in pygame.event.get():
+            for event in batch:
                 if event.type == pygame.QUIT:
-                    with self._windows[display_idx]["lock"]:
-                        self._windows[display_idx]["visible"] = False
+                    state.visible = False
                 elif event.type == pygame.MOUSEMOTION:
-                    current_time = pygame.time.get_ticks()
+                    # Motion only matters for the comparison split and while dragging
+                    if display_mode != "comparison" and not dragging:
+                        continue
+
+                    # Update mouse position for comparison mode
+                    if display_mode == "comparison" and event.pos[0] != mouse_x:
+                        mouse_x = event.pos[0]
+                        last_interaction_ns = work_start_ns
                     
-                    # Throttle mouse updates for better performance
-                    if current_time - last_mouse_update > mouse_throttle_interval:
-                        # Update mouse position for comparison mode
-                        if display_mode == "comparison":
-                            mouse_x = event.pos[0]
-                            # Force redraw when mouse moves in comparison mode
-                            needs_redraw = True
-                        
-                        # Handle panning when dragging
-                        if dragging:
-                            dx = event.pos[0] - last_mouse_pos[0]
-                            dy = event.pos[1] - last_mouse_pos[1]
-                            with self._windows[display_idx]["lock"]:
-                                self._windows[display_idx]["pan_x"] += dx
-                                self._windows[display_idx]["pan_y"] += dy
-                            needs_redraw = True
-                        
-                        last_mouse_pos = event.pos
-                        last_mouse_update = current_time
+                    # Handle panning when dragging
+                    if dragging:
+                        pan_dx += event.pos[0] - last_mouse_pos[0]
+                        pan_dy += event.pos[1] - last_mouse_pos[1]
+                    
+                    last_mouse_pos = event.pos
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left mouse button
                         dragging = True
@@ -575,133 +1221,51 @@ class PreviewImageMonitor:
                     if event.button == 1:  # Left mouse button
                         dragging = False
                 elif event.type == pygame.MOUSEWHEEL:
-                    # Handle zoom with mouse wheel
-                    zoom_factor = 1.1 if event.y > 0 else 0.9
-                    with self._windows[display_idx]["lock"]:
-                        new_zoom = self._windows[display_idx]["zoom"] * zoom_factor
-                        # Limit zoom range
-                        new_zoom = max(0.1, min(10.0, new_zoom))
-                        self._windows[display_idx]["zoom"] = new_zoom
-                    needs_redraw = True
+                    zoom_factor *= 1.1 if event.y > 0 else 0.9
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        with self._windows[display_idx]["lock"]:
-                            self._windows[display_idx]["visible"] = False
-                    elif event.key == pygame.K_LEFT and display_mode == "slideshow":
-                        # Previous image
-                        with self._windows[display_idx]["lock"]:
-                            if len(images) > 1:
-                                self._windows[display_idx]["current_idx"] = (current_idx - 1) % len(images)
-                                print(f"Preview Monitor: Showing image {self._windows[display_idx]['current_idx'] + 1}/{len(images)}")
-                    elif event.key == pygame.K_RIGHT and display_mode == "slideshow":
-                        # Next image
-                        with self._windows[display_idx]["lock"]:
-                            if len(images) > 1:
-                                self._windows[display_idx]["current_idx"] = (current_idx + 1) % len(images)
-                                print(f"Preview Monitor: Showing image {self._windows[display_idx]['current_idx'] + 1}/{len(images)}")
-                    elif event.key == pygame.K_c:
-                        # Toggle comparison mode
-                        with self._windows[display_idx]["lock"]:
-                            if self._windows[display_idx]["display_mode"] == "comparison":
-                                self._windows[display_idx]["display_mode"] = "single"
-                                print("Preview Monitor: Switched to single image mode")
-                            else:
-                                self._windows[display_idx]["display_mode"] = "comparison"
-                                print("Preview Monitor: Switched to comparison mode")
-                    elif event.key == pygame.K_s:
-                        # Toggle slideshow mode
-                        with self._windows[display_idx]["lock"]:
-                            if self._windows[display_idx]["display_mode"] == "slideshow":
-                                self._windows[display_idx]["display_mode"] = "single"
-                                print("Preview Monitor: Switched to single image mode")
-                            else:
-                                self._windows[display_idx]["display_mode"] = "slideshow"
-                                print("Preview Monitor: Switched to slideshow mode")
-                    elif event.key == pygame.K_r:
-                        # Reset zoom and pan
-                        with self._windows[display_idx]["lock"]:
-                            self._windows[display_idx]["zoom"] = 1.0
-                            self._windows[display_idx]["pan_x"] = 0.0
-                            self._windows[display_idx]["pan_y"] = 0.0
-                        needs_redraw = True
-                        print("Preview Monitor: Reset zoom and pan")
-                    elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
-                        # Zoom in
-                        with self._windows[display_idx]["lock"]:
-                            new_zoom = min(10.0, self._windows[display_idx]["zoom"] * 1.2)
-                            self._windows[display_idx]["zoom"] = new_zoom
-                        needs_redraw = True
-                    elif event.key == pygame.K_MINUS:
-                        # Zoom out
-                        with self._windows[display_idx]["lock"]:
-                            new_zoom = max(0.1, self._windows[display_idx]["zoom"] * 0.8)
-                            self._windows[display_idx]["zoom"] = new_zoom
-                        needs_redraw = True
-                    elif event.key == pygame.K_m:
-                        # Toggle mouse visibility
-                        current_visible = pygame.mouse.get_visible()
-                        pygame.mouse.set_visible(not current_visible)
-                        print(f"Preview Monitor: Mouse cursor {'shown' if not current_visible else 'hidden'}")
-                    elif event.key == pygame.K_q:
-                        # Force cleanup all windows
-                        self.cleanup_all_windows()
-                        print("Preview Monitor: All windows cleaned up")
-                    elif event.key == pygame.K_h:
-                        # Show help
-                        print("Preview Monitor Controls:")
-                        print("  ESC - Hide window")
-                        print("  S - Toggle slideshow mode")
-                        print("  C - Toggle comparison mode")
-                        print("  Left/Right Arrow - Navigate images (slideshow mode)")
-                        print("  Mouse Movement - Control split line in comparison mode")
-                        print("  Mouse Wheel - Zoom in/out")
-                        print("  Left Mouse Drag - Pan image")
-                        print("  +/- - Zoom in/out")
-                        print("  R - Reset zoom and pan")
-                        print("  M - Toggle mouse cursor visibility")
-                        print("  Q - Force cleanup all windows")
-                        print("  H - Show this help")
-                        print("")
-                        print("Comparison Mode:")
-                        print("  - Two images are overlaid")
-                        print("  - Move mouse left/right to control split line")
-                        print("  - Left side shows top image, right side shows bottom image")
-                        print("")
-                        print("Zoom and Pan:")
-                        print("  - Mouse wheel: zoom in/out")
-                        print("  - Left mouse drag: pan image")
-                        print("  - +/- keys: zoom in/out")
-                        print("  - R key: reset zoom and pan")
-
-            # Performance monitoring and adaptive throttling
-            frame_count += 1
-            current_time = pygame.time.get_ticks()
-            if current_time - last_fps_time > 1000:  # Update FPS every second
-                actual_fps = frame_count * 1000 / (current_time - last_fps_time)
-                
-                # Adaptive performance adjustment
-                if actual_fps < target_fps * 0.7:  # If FPS is significantly lower than target
-                    if performance_mode != "high_performance":
-                        performance_mode = "high_performance"
-                        mouse_throttle_interval = 33  # ~30fps for mouse updates
-                        print(f"Preview Monitor: Switched to high performance mode (FPS: {actual_fps:.1f})")
-                elif actual_fps > target_fps * 0.9:  # If FPS is good
-                    if performance_mode != "normal":
-                        performance_mode = "normal"
-                        mouse_throttle_interval = 16  # ~60fps for mouse updates
-                        print(f"Preview Monitor: Switched to normal mode (FPS: {actual_fps:.1f})")
-                
-                frame_count = 0
-                last_fps_time = current_time
-            
-            clock.tick(target_fps)
+                    if event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
+                        zoom_factor *= 1.2
+                        continue
+                    if event.key == pygame.K_MINUS:
+                        zoom_factor *= 0.8
+                        continue
+                    handler = _KEY_HANDLERS.get(event.key)
+                    # A handler that replaces the view drops the zoom and pan queued before it;
+                    # steps queued after it still apply on top of the new view
+                    if handler is not None and handler(self, state):
+                        zoom_factor = 1.0
+                        pan_dx = pan_dy = 0
+
+            if zoom_factor != 1.0 or pan_dx or pan_dy:
+                view = state.view
+                # Limit zoom range (clamped once for the whole batch)
+                new_view = view._replace(zoom=max(0.1, min(10.0, view.zoom * zoom_factor)),
+                                         pan_x=view.pan_x + pan_dx, pan_y=view.pan_y + pan_dy)
+                # Held keys at the zoom limit change nothing: no swap, no draft/settle redraw pair
+                if new_view != view:
+                    state.view = new_view
+                    last_interaction_ns = work_start_ns
 
         # Clean up pygame resources for this window
         try:
             pygame.display.quit()
-            print(f"Preview Monitor: Window on monitor {display_idx} cleaned up")
+            _log(f"Preview Monitor: Window on monitor {display_idx} cleaned up")
         except Exception as e:
-            print(f"Preview Monitor: Error cleaning up window on monitor {display_idx}: {e}")
+            _log(f"Preview Monitor: Error cleaning up window on monitor {display_idx}: {e}")
+
+
+# KEYDOWN dispatch for the window loop (+/- zoom keys are folded into the batch zoom factor)
+_KEY_HANDLERS = {
+    pygame.K_ESCAPE: PreviewImageMonitor._key_hide,
+    pygame.K_LEFT: PreviewImageMonitor._key_previous_image,
+    pygame.K_RIGHT: PreviewImageMonitor._key_next_image,
+    pygame.K_c: PreviewImageMonitor._key_toggle_comparison,
+    pygame.K_s: PreviewImageMonitor._key_toggle_slideshow,
+    pygame.K_r: PreviewImageMonitor._key_reset_view,
+    pygame.K_m: PreviewImageMonitor._key_toggle_mouse,
+    pygame.K_q: PreviewImageMonitor._key_cleanup_all,
+    pygame.K_h: PreviewImageMonitor._key_help,
+} if PYGAME_AVAILABLE else {}
 
 
 # Node registration